@@ -12,31 +12,45 @@ try:
     import board
     import busio
     import digitalio
+
+    # probe these once; board attribute access can construct pin
+    #  objects on CircuitPython
+    _HAS_SCK1 = getattr(board, "SCK1", None) is not None
+    _HAS_ESP_CS = getattr(board, "ESP_CS", None) is not None
 except (ImportError, NotImplementedError):
-    pass
+    _HAS_SCK1 = False
+    _HAS_ESP_CS = False
 
 is_microcontroller = sys.implementation.name == "circuitpython"
 
 
-_global_found_radios = {}
-_global_print = True
+_global_radios = {}
+_global_radio_pins = {}
 _global_spi = None
+_global_wifi_creds = None
+_pin_cache = {}
+_radio_by_id = {}
+_esp32spi_mod = None
+_wiznet5k_mod = None
 
 
-def enable_log(enable):
-    global _global_print  # noqa: PLW0603 Using the global statement to update variable is discouraged
-    _global_print = enable
+def _noop_log(value):
+    pass
 
 
-def log(value):
-    if _global_print:
-        print(value)
+# rebound by enable_log so callers skip the enabled check entirely
+log = print
+
+
+def enable_log(enable):
+    global log  # noqa: PLW0603 Using the global statement to update variable is discouraged
+    log = print if enable else _noop_log
 
 
 def get_global_spi():
     global _global_spi  # noqa: PLW0603 Using the global statement to update variable is discouraged
     if _global_spi is None:
-        if getattr(board, "SCK1", None):
+        if _HAS_SCK1:
             _global_spi = busio.SPI(board.SCK1, board.MOSI1, board.MISO1)
         else:
             _global_spi = busio.SPI(board.SCK, board.MOSI, board.MISO)
@@ -44,24 +58,48 @@ def get_global_spi():
 
 
 def get_pin(env_name, default):
+    # board attributes and settings.toml don't change at runtime, so
+    #  resolving each env_name once avoids re-parsing settings.toml
+    if env_name in _pin_cache:
+        return _pin_cache[env_name]
+
     pin_name = os.getenv(env_name, default)
     pin = getattr(board, pin_name, None)
     if pin is None:
         raise ValueError(f"Pin {pin_name} for {env_name} not found")
+    _pin_cache[env_name] = pin
     return pin
 
 
+def _get_wifi_creds():
+    # os.getenv parses settings.toml from flash on every call in
+    #  CircuitPython, so only resolve the credentials once
+    global _global_wifi_creds  # noqa: PLW0603 Using the global statement to update variable is discouraged
+    if _global_wifi_creds is None:
+        ssid = os.getenv("WIFI_SSID")
+        if ssid:
+            password = os.getenv("WIFI_PASSWORD")
+        else:
+            ssid = os.getenv("CIRCUITPY_WIFI_SSID")
+            password = os.getenv("CIRCUITPY_WIFI_PASSWORD")
+        _global_wifi_creds = (ssid, password)
+    return _global_wifi_creds
+
+
+def invalidate_wifi_creds():
+    global _global_wifi_creds  # noqa: PLW0603 Using the global statement to update variable is discouraged
+    _global_wifi_creds = None
+
+
 def get_saved_radio(name):
-    if name in _global_found_radios:
-        return _global_found_radios[name]["radio"]
-    return None
+    return _global_radios.get(name)
 
 
 def save_radio(name, radio, pins=None):
-    _global_found_radios[name] = {
-        "radio": radio,
-        "pins": pins,
-    }
+    _global_radios[name] = radio
+    if pins:
+        _global_radio_pins[name] = pins
+    _radio_by_id[id(radio)] = name
 
 
 def connect_radio(radio):
@@ -73,12 +111,7 @@ def connect_radio(radio):
         log("Already connected")
         return
 
-    ssid = os.getenv("WIFI_SSID")
-    if ssid:
-        password = os.getenv("WIFI_PASSWORD")
-    else:
-        ssid = os.getenv("CIRCUITPY_WIFI_SSID")
-        password = os.getenv("CIRCUITPY_WIFI_PASSWORD")
+    ssid, password = _get_wifi_creds()
 
     if ssid is None:
         raise AttributeError("Can't find SSID information in settings.toml")
@@ -92,21 +125,16 @@ def connect_radio(radio):
 
 
 def deinit_radio(radio):
-    match = None
-    for key, data in _global_found_radios.items():
-        if data["radio"] == radio:
-            match = key
-            break
-
-    if match is None:
+    name = _radio_by_id.pop(id(radio), None)
+    if name is None:
         raise ValueError("Radio not found")
 
-    pins = _global_found_radios[key]["pins"]
-    if isinstance(pins, list):
+    del _global_radios[name]
+    pins = _global_radio_pins.pop(name, None)
+    if pins:
         for pin in pins:
             pin.deinit()
 
-    del _global_found_radios[key]
     del radio
 
 
@@ -130,15 +158,20 @@ def get_esp32spi_radio(raise_exception=True):
     if radio:
         return radio
 
-    try:
-        from adafruit_esp32spi import adafruit_esp32spi
+    # cache the module so repeated probes don't re-run the import
+    #  machinery (a flash parse on CircuitPython)
+    global _esp32spi_mod  # noqa: PLW0603 Using the global statement to update variable is discouraged
+    if _esp32spi_mod is None:
+        try:
+            from adafruit_esp32spi import adafruit_esp32spi
 
-    except ImportError as exc:
-        if raise_exception:
-            raise RuntimeError("ESP32SPI library not found") from exc
-        return None
+        except ImportError as exc:
+            if raise_exception:
+                raise RuntimeError("ESP32SPI library not found") from exc
+            return None
+        _esp32spi_mod = adafruit_esp32spi
 
-    if getattr(board, "ESP_CS", None) is not None:
+    if _HAS_ESP_CS:
         esp32_chip_select_pin = board.ESP_CS
         esp32_ready_pin = board.ESP_BUSY
         esp32_reset_pin = board.ESP_RESET
@@ -151,7 +184,7 @@ def get_esp32spi_radio(raise_exception=True):
     esp32_ready = digitalio.DigitalInOut(esp32_ready_pin)
     esp32_reset = digitalio.DigitalInOut(esp32_reset_pin)
     spi = get_global_spi()
-    radio = adafruit_esp32spi.ESP_SPIcontrol(
+    radio = _esp32spi_mod.ESP_SPIcontrol(
         spi, esp32_chip_select, esp32_ready, esp32_reset
     )
 
@@ -195,21 +228,24 @@ def get_wiznet5k_radio(raise_exception=True):
     if radio:
         return radio
 
-    try:
-        from adafruit_wiznet5k import adafruit_wiznet5k
+    global _wiznet5k_mod  # noqa: PLW0603 Using the global statement to update variable is discouraged
+    if _wiznet5k_mod is None:
+        try:
+            from adafruit_wiznet5k import adafruit_wiznet5k
 
-    except ImportError as exc:
-        if raise_exception:
-            raise RuntimeError("WIZnet5k library not found") from exc
-        return None
+        except ImportError as exc:
+            if raise_exception:
+                raise RuntimeError("WIZnet5k library not found") from exc
+            return None
+        _wiznet5k_mod = adafruit_wiznet5k
 
     wiznet_chip_select_pin = get_pin("WIZNET_CHIP_SELECT", "D10")
     wiznet_chip_select = digitalio.DigitalInOut(wiznet_chip_select_pin)
     spi = get_global_spi()
     try:
-        radio = adafruit_wiznet5k.WIZNET5K(spi, wiznet_chip_select, is_dhcp=True)
+        radio = _wiznet5k_mod.WIZNET5K(spi, wiznet_chip_select, is_dhcp=True)
     except RuntimeError as exc:
-        chip_select.deinit()
+        wiznet_chip_select.deinit()
 
         if raise_exception:
             raise RuntimeError("WIZnet5k radio not found") from exc
@@ -220,6 +256,14 @@ def get_wiznet5k_radio(raise_exception=True):
     return radio
 
 
+# probed in order when no radio is forced
+_RADIO_PROBES = {
+    "wifi": get_wifi_radio,
+    "esp32spi": get_esp32spi_radio,
+    "wiznet5k": get_wiznet5k_radio,
+}
+
+
 def get_radio(connect=True, force=None):
     radio = None
     log("Detecting radio...")
@@ -227,14 +271,16 @@ def get_radio(connect=True, force=None):
     if not is_microcontroller:
         radio = get_cpython_radio(raise_exception=False)
 
-    if radio is None and force is None or force == "wifi":
-        radio = get_wifi_radio(raise_exception=force)
-
-    if radio is None and force is None or force == "esp32spi":
-        radio = get_esp32spi_radio(raise_exception=force)
-
-    if radio is None and force is None or force == "wiznet5k":
-        radio = get_wiznet5k_radio(raise_exception=force)
+    if radio is None:
+        if force:
+            probe = _RADIO_PROBES.get(force)
+            if probe:
+                radio = probe(raise_exception=True)
+        else:
+            for probe in _RADIO_PROBES.values():
+                radio = probe(raise_exception=False)
+                if radio:
+                    break
 
     if radio is None:
         raise RuntimeError("Cannot determine radio")
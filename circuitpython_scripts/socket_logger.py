@@ -5,24 +5,112 @@
 import sys
 import time
 
-
-def _log_method(obj_hash, method, result, *args, **kwargs):
-    print(f"{time.monotonic():<0.3f} | ", end="")
-    print(f"{obj_hash:14} - {method:12} | ", end="")
-    print(f"result: {str(result):12} | ", end="")
+is_microcontroller = sys.implementation.name == "circuitpython"
+
+_global_print = True
+
+# note: we can not easily copy all methods, because calling
+#  `dir(socket)` calls the actual properties and thus can have
+#  bad effects
+_OTHER_METHOD_NAMES = (
+    "accept",
+    "bind",
+    "listen",
+    "recv",
+    "recvfrom_into",
+    "sendall",
+    "setblocking",
+    "setsockopt",
+)
+if not is_microcontroller:
+    _OTHER_METHOD_NAMES += (
+        "detach",
+        "fileno",
+        "gettimeout",
+        "getsockopt",
+    )
+
+
+def enable_log(enable):
+    global _global_print  # noqa: PLW0603 Using the global statement to update variable is discouraged
+    _global_print = enable
+
+
+class _LazyBytes:
+    # defers the bytes() copy of a buffer (possibly a memoryview)
+    #  until the value is actually formatted, so disabled logging
+    #  never pays for it
+    def __init__(self, buffer, size=None):
+        self._buffer = buffer
+        self._size = size
+
+    def __bytes__(self):
+        if self._size is None:
+            return bytes(self._buffer)
+        return bytes(self._buffer[: self._size])
+
+    def __str__(self):
+        return str(self.__bytes__())
+
+    __repr__ = __str__
+
+
+def _log_method(
+    obj_hash, method, result, *args, _monotonic=time.monotonic, _print=print, **kwargs
+):
+    if not _global_print:
+        return
+
+    # build one string and print once; the default args bind the
+    #  globals as locals to keep this hot path cheap
+    parts = [
+        f"{_monotonic():<0.3f} | {obj_hash:14} - {method:12} | result: {str(result):12} | "
+    ]
 
     result_hash = kwargs.pop("result_hash", None)
     if result_hash:
-        print(f"socket hash: {result_hash} | ", end="")
+        parts.append(f"socket hash: {result_hash} | ")
 
     if args:
-        str_args = " ".join([str(arg) for arg in args])
-        print(f"args: {str_args}", end="")
+        str_args = " ".join(str(arg) for arg in args)
+        parts.append(f"args: {str_args}")
+
+    _print("".join(parts))
+
 
-    print("")
+def _log_kv(
+    obj_hash, method, result, kv_string, _monotonic=time.monotonic, _print=print
+):
+    # fast path for callers with a preformatted key/value string;
+    #  skips _log_method's per-arg loop
+    if not _global_print:
+        return
+
+    _print(
+        f"{_monotonic():<0.3f} | {obj_hash:14} - {method:12} | "
+        f"result: {str(result):12} | args: {kv_string}"
+    )
 
 
 class SocketLogger:
+    # fixed fields plus every method name enable_log or __init__ may
+    #  bind on the instance; dropping the instance dict saves memory
+    #  per wrapped socket
+    __slots__ = (
+        "_socket",
+        "_family",
+        "_type",
+        "_proto",
+        "_hash_cached",
+        *_OTHER_METHOD_NAMES,
+        "close",
+        "connect",
+        "recv_into",
+        "send",
+        "sendto",
+        "settimeout",
+    )
+
     def __init__(  # noqa: PLR0913 - Too many arguments
         self,
         socket,
@@ -42,31 +130,9 @@ class SocketLogger:
         self._type = type
         self._proto = proto
 
-        self._hash = hash(self._socket)
-
-        # note: we can not easily copy all methods, because calling
-        #  `dir(socket)` calls the actual properties and thus can have
-        #  bad effects
-        other_method_names = [
-            "accept",
-            "bind",
-            "listen",
-            "recv",
-            "recvfrom_into",
-            "sendall",
-            "setblocking",
-            "setsockopt",
-        ]
-        if sys.implementation.name != "circuitpython":
-            other_method_names.extend(
-                [
-                    "detach",
-                    "fileno",
-                    "gettimeout",
-                    "getsockopt",
-                ]
-            )
-        for other_method_name in other_method_names:
+        self._hash_cached = None
+
+        for other_method_name in _OTHER_METHOD_NAMES:
             other_method = getattr(self._socket, other_method_name, None)
             if other_method:
                 setattr(self, other_method_name, other_method)
@@ -102,6 +168,13 @@ class SocketLogger:
         if hasattr(self._socket, "__exit__"):
             return self._socket.__exit__(exc_type, exc_val, exc_tb)
 
+    @property
+    def _hash(self):
+        # only pay for hashing the socket once something is logged
+        if self._hash_cached is None:
+            self._hash_cached = hash(self._socket)
+        return self._hash_cached
+
     @property
     def family(self):
         return getattr(self._socket, "family", self._family)
@@ -121,7 +194,7 @@ class SocketLogger:
             if bytes_arg == -1:
                 _log_method(self._hash, method_name, result, *log_args)
             else:
-                result_bytes = bytes(args[bytes_arg][:result])
+                result_bytes = _LazyBytes(args[bytes_arg], result)
                 _log_method(self._hash, method_name, [result, result_bytes], *log_args)
             return result
         except Exception as exc:
@@ -151,26 +224,45 @@ class SocketLogger:
         )
 
     def _log_send(self, b):
-        # `b` could be a memoryview, force to bytes
-        log_args = ["bytes:", bytes(b)]
+        # `b` could be a memoryview, _LazyBytes forces to bytes when printed
+        log_args = ["bytes:", _LazyBytes(b)]
         return self._call_method("send", self._socket.send, log_args, b)
 
     def _log_sendto(self, b, address):
-        # `b` could be a memoryview, force to bytes
-        log_args = ["bytes:", bytes(b), "address:", address[0], "port:", address[1]]
+        # `b` could be a memoryview, _LazyBytes forces to bytes when printed
+        log_args = [
+            "bytes:",
+            _LazyBytes(b),
+            "address:",
+            address[0],
+            "port:",
+            address[1],
+        ]
         return self._call_method("sendto", self._socket.sendto, log_args, b, address)
 
     def _log_settimeout(self, value):
         log_args = ["value:", value]
         return self._call_method("settimeout", self._socket.settimeout, log_args, value)
 
+    _LOG_METHODS = {
+        "close": _log_close,
+        "connect": _log_connect,
+        "recv_into": _log_recv_into,
+        "send": _log_send,
+        "sendto": _log_sendto,
+        "settimeout": _log_settimeout,
+    }
+
     def enable_log(self, enable, method_name):
         native_method = getattr(self._socket, method_name)
         if native_method is None:
             return
 
-        log_method = getattr(self, f"_log_{method_name}", native_method)
-        method = log_method if enable else native_method
+        log_method = self._LOG_METHODS.get(method_name)
+        if enable and log_method:
+            method = log_method.__get__(self)
+        else:
+            method = native_method
         setattr(self, method_name, method)
 
 
@@ -200,28 +292,18 @@ class SocketPoolLogger:
         return self._socket_pool.AF_INET
 
     def getaddrinfo(self, host=None, port=None, family=0, type=0, proto=0, flags=0):  # noqa: PLR0913 - Too many arguments
-        log_args = [
-            "host:",
-            host,
-            "port:",
-            port,
-            "family:",
-            family,
-            "type:",
-            type,
-            "proto:",
-            proto,
-            "flags:",
-            flags,
-        ]
+        kv_string = (
+            f"host: {host} port: {port} family: {family} "
+            f"type: {type} proto: {proto} flags: {flags}"
+        )
         try:
             result = self._socket_pool.getaddrinfo(
                 host, port, family, type, proto, flags
             )
-            _log_method(self._hash, "getaddrinfo", result, *log_args)
+            _log_kv(self._hash, "getaddrinfo", result, kv_string)
             return result
         except Exception as exc:
-            _log_method(self._hash, "getaddrinfo", exc, *log_args)
+            _log_kv(self._hash, "getaddrinfo", exc, kv_string)
             raise
 
     def socket(self, family=0, type=0, proto=0, fileno=None):